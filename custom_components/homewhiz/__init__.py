@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from functools import partial
 
 from dacite import from_dict
 from homeassistant.components.bluetooth import (
@@ -10,16 +11,22 @@ from homeassistant.components.bluetooth import (
     async_register_callback,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.requirements import RequirementsNotFound
 from homeassistant.util.package import install_package, is_installed
 
 from .api import IdExchangeResponse
+from .appliance_controls import (
+    clear_controls,
+    generate_controls_by_type,
+    platforms_for_controls,
+)
 from .bluetooth import HomewhizBluetoothUpdateCoordinator
 from .cloud import HomewhizCloudUpdateCoordinator
 from .config_flow import CloudConfig
-from .const import CONF_BT_RECONNECT_INTERVAL, DOMAIN, PLATFORMS
+from .const import CONF_BT_RECONNECT_INTERVAL, DOMAIN
+from .helper import build_entry_data, register_entry_cache_cleanup
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
@@ -32,11 +39,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "Appliance config not fetched from the API. "
             "Please configure the integration again"
         )
+    register_entry_cache_cleanup(entry)
+    # Build the entry data and controls shared by all platforms once up front,
+    # the platforms then only pick them from the caches
+    data = build_entry_data(entry)
+    generate_controls_by_type(entry.entry_id, data.contents.config)
+    entry.async_on_unload(partial(clear_controls, entry.entry_id))
     if entry.data["cloud_config"] is not None:
-        return await setup_cloud(entry, hass)
+        return await setup_cloud(entry, hass, data.ids)
     return await setup_bluetooth(address, entry, hass)
 
 
+def _entry_platforms(entry: ConfigEntry) -> list[Platform]:
+    """Platforms with entities for the entry, the others are not set up at all."""
+    data = build_entry_data(entry)
+    return platforms_for_controls(entry.entry_id, data.contents.config)
+
+
 async def setup_bluetooth(
     address: str | None, entry: ConfigEntry, hass: HomeAssistant
 ) -> bool:
@@ -69,7 +88,7 @@ async def setup_bluetooth(
             _LOGGER.debug("Called connect callback in setup_bluetooth")
             hass.async_create_task(connect_retrieving_errors())
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, _entry_platforms(entry))
     entry.async_on_unload(
         async_register_callback(
             hass,
@@ -97,19 +116,20 @@ def _lazy_install_awsiotsdk() -> None:
             raise RequirementsNotFound(DOMAIN, [pkg])
 
 
-async def setup_cloud(entry: ConfigEntry, hass: HomeAssistant) -> bool:
+async def setup_cloud(
+    entry: ConfigEntry, hass: HomeAssistant, ids: IdExchangeResponse
+) -> bool:
     _LOGGER.info("Setting up cloud connection")
 
     loop = asyncio.get_event_loop()
     lazy_install_awsiotsdk_task = loop.run_in_executor(None, _lazy_install_awsiotsdk)
     await lazy_install_awsiotsdk_task
 
-    ids = from_dict(IdExchangeResponse, entry.data["ids"])
     cloud_config = from_dict(CloudConfig, entry.data["cloud_config"])
     coordinator = hass.data.setdefault(DOMAIN, {})[entry.entry_id] = (
         HomewhizCloudUpdateCoordinator(hass, ids.appId, cloud_config, entry)
     )
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, _entry_platforms(entry))
     entry.async_create_task(hass, coordinator.connect())
     _LOGGER.info("Setup cloud connection successfully")
     return True
@@ -118,6 +138,8 @@ async def setup_cloud(entry: ConfigEntry, hass: HomeAssistant) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Unloading entry %s", entry.unique_id)
     await hass.data[DOMAIN][entry.entry_id].kill()
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, _entry_platforms(entry)
+    ):
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
@@ -211,9 +211,10 @@ async def make_api_get_request(
         f"{payload_hash}"
     )
 
-    _LOGGER.debug(
-        "Actual canonical request: {}".format(canonical_request.replace("\n", "\\n"))  # noqa: G001
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Actual canonical request: %s", canonical_request.replace("\n", "\\n")
+        )
 
     credential_scope = f"{date_stamp}/{REGION}/{SERVICE}/aws4_request"
     string_to_sign = (
@@ -315,9 +316,10 @@ async def fetch_localizations(contents_index: ContentsIndexResponse) -> dict[str
     return reduce(lambda a, b: a | b, localizations)
 
 
-async def fetch_appliance_contents(
+async def fetch_raw_appliance_contents(
     credentials: LoginResponse, app_id: str, language: str = "en-GB"
-) -> ApplianceContents:
+) -> dict[str, Any]:
+    """Fetch the appliance contents as the plain dict of ApplianceContents."""
     contents_index = await fetch_contents_index(credentials, app_id, language)
     config_contents = [
         content
@@ -328,8 +330,16 @@ async def fetch_appliance_contents(
     config = await make_get_contents_request(config_contents[0])
     localization = await fetch_localizations(contents_index)
 
+    return {"config": config, "localization": localization}
+
+
+async def fetch_appliance_contents(
+    credentials: LoginResponse, app_id: str, language: str = "en-GB"
+) -> ApplianceContents:
+    contents = await fetch_raw_appliance_contents(credentials, app_id, language)
     return ApplianceContents(
-        config=from_dict(ApplianceConfiguration, config), localization=localization
+        config=from_dict(ApplianceConfiguration, contents["config"]),
+        localization=contents["localization"],
     )
 
 
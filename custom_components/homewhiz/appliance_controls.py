@@ -4,7 +4,8 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, fields
 from datetime import UTC, datetime, timedelta
-from typing import Any, Generic, TypeVar
+from functools import cached_property
+from typing import Any, Generic, TypeVar, cast
 
 from bidict import bidict
 from homeassistant.components.climate import (  # type: ignore[import]
@@ -16,6 +17,7 @@ from homeassistant.components.climate import (  # type: ignore[import]
     SWING_VERTICAL,
     HVACMode,
 )
+from homeassistant.const import Platform
 
 from custom_components.homewhiz.appliance_config import (
     ApplianceConfiguration,
@@ -32,6 +34,7 @@ from custom_components.homewhiz.appliance_config import (
 )
 from custom_components.homewhiz.helper import unit_for_key
 
+from .const import PLATFORMS
 from .homewhiz import Command
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -110,6 +113,11 @@ class EnumControl(Control, Generic[_Options]):
         self.read_index = read_index
         self.options = options
 
+    @cached_property
+    def options_list(self) -> list[str]:
+        """Option names shared by every entity built from this control"""
+        return list(self.options.values())
+
     def get_value(self, data: bytearray) -> str | None:
         byte = safe_get(data, self.read_index)
         if byte in self.options:
@@ -298,13 +306,28 @@ class SummedTimestampControl(Control):
     def __init__(self, key: str, sensors: list[Control]):
         self.key = key
         self.sensors = sensors
+        self._sources: list[dict[str, str]] | None = None
+
+    def sources(self) -> list[dict[str, str]]:
+        """Entity mappings of the sensors used, kept once every sensor has one"""
+        if self._sources is not None:
+            return self._sources
+        sources = [
+            mapping
+            for sensor in self.sensors
+            if (mapping := getattr(sensor, "my_entity_ids", None)) is not None
+        ]
+        if len(sources) == len(self.sensors):
+            self._sources = sources
+        return sources
 
     def get_value(self, data: bytearray) -> datetime | None:
-        _LOGGER.debug(
-            "Calculating Time for %s from %s",
-            self.key,
-            [sensor.key for sensor in self.sensors],
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Calculating Time for %s from %s",
+                self.key,
+                [sensor.key for sensor in self.sensors],
+            )
         minute_delta = sum(sensor.get_value(data) for sensor in self.sensors)
         if minute_delta < 1:
             _LOGGER.debug("Device Running or No Delay Active")
@@ -620,10 +643,10 @@ def get_bounded_values_options(
     key: str, values: ApplianceFeatureBoundedOption
 ) -> bidict[int, str]:
     result: bidict[int, str] = bidict()
+    unit = unit_for_key(key)
     value = float(values.lowerLimit)
     while value <= values.upperLimit:
         wifiValue = int(value / values.factor)
-        unit = unit_for_key(key)
         value_str = f"{value:g}"
         name = f"{value_str}{unit}" if unit is not None else value_str
         result[wifiValue] = to_friendly_name(name)
@@ -1205,11 +1228,10 @@ def generate_controls_from_config(
             build_controls_from_monitorings(getattr(config, "monitorings", None) or [])
         )
 
+        progress_variables = getattr(config, "progressVariables", None)
         progress_controls = (
-            build_controls_from_progress_variables(
-                getattr(config, "progressVariables", None), state_control
-            )
-            if getattr(config, "progressVariables", None) is not None
+            build_controls_from_progress_variables(progress_variables, state_control)
+            if progress_variables is not None
             else []
         )
 
@@ -1217,13 +1239,10 @@ def generate_controls_from_config(
             getattr(config, "remoteControl", None)
         )
 
-        warnings_controls: list[Control] = []
-        if getattr(config, "deviceWarnings", None) is not None:
-            warnings_controls.extend(
-                build_controls_from_warnings(config.deviceWarnings)
-            )
-        if getattr(config, "warnings", None) is not None:
-            warnings_controls.extend(build_controls_from_warnings(config.warnings))
+        warnings_controls = [
+            *build_controls_from_warnings(getattr(config, "deviceWarnings", None)),
+            *build_controls_from_warnings(getattr(config, "warnings", None)),
+        ]
 
         settings_controls = list(
             build_controls_from_features(getattr(config, "settings", None) or [])
@@ -1262,3 +1281,111 @@ def generate_controls_from_config(
         controls[key] = extract_ac_control(tmp_controls)
 
     return controls[key]
+
+
+# Generated controls grouped by their exact type, so the platforms can pick the
+# controls they handle without checking every control
+controls_by_type: dict[str, dict[type[Control], list[Control]]] = {}
+
+
+def generate_controls_by_type(
+    key: str,
+    config: ApplianceConfiguration,
+) -> dict[type[Control], list[Control]]:
+    if key not in controls_by_type:
+        buckets: dict[type[Control], list[Control]] = {}
+        for control in generate_controls_from_config(key, config):
+            buckets.setdefault(type(control), []).append(control)
+        controls_by_type[key] = buckets
+
+    return controls_by_type[key]
+
+
+_C = TypeVar("_C", bound=Control)
+
+
+def generate_controls_of_type(
+    key: str,
+    config: ApplianceConfiguration,
+    control_type: type[_C],
+) -> list[_C]:
+    """Return the controls of exactly control_type."""
+    # The buckets are keyed by the exact type of their controls
+    return cast(
+        "list[_C]", generate_controls_by_type(key, config).get(control_type, [])
+    )
+
+
+def generate_controls_of_types(
+    key: str,
+    config: ApplianceConfiguration,
+    types: tuple[type[_C], ...],
+) -> list[_C]:
+    """Return the controls that are instances of types, including subclasses."""
+    return [
+        cast("_C", control)
+        for control_type, bucket in generate_controls_by_type(key, config).items()
+        if issubclass(control_type, types)
+        for control in bucket
+    ]
+
+
+SelectControl = WriteEnumControl | WriteNumericControl
+SensorControl = (
+    TimeControl
+    | EnumControl[Any]
+    | NumericControl
+    | DebugControl
+    | SummedTimestampControl
+    | StateAwareRemainingTimeControl
+)
+
+# Control types of the platforms that handle more than one
+SELECT_CONTROL_TYPES: tuple[type[SelectControl], ...] = (
+    WriteEnumControl,
+    WriteNumericControl,
+)
+SENSOR_CONTROL_TYPES: tuple[type[SensorControl], ...] = (
+    TimeControl,
+    EnumControl,
+    NumericControl,
+    DebugControl,
+    SummedTimestampControl,
+    StateAwareRemainingTimeControl,
+)
+BINARY_SENSOR_CONTROL_TYPES: tuple[type[BooleanControl], ...] = (
+    BooleanBitmaskControl,
+    BooleanCompareControl,
+)
+
+# Control types each platform creates entities for, including their subclasses
+CONTROL_TYPES_BY_PLATFORM: dict[Platform, tuple[type[Control], ...]] = {
+    Platform.SELECT: SELECT_CONTROL_TYPES,
+    Platform.SENSOR: SENSOR_CONTROL_TYPES,
+    Platform.NUMBER: (WriteTimeControl,),
+    Platform.CLIMATE: (ClimateControl,),
+    Platform.SWITCH: (WriteBooleanControl,),
+    Platform.BINARY_SENSOR: BINARY_SENSOR_CONTROL_TYPES,
+}
+
+
+def platforms_for_controls(
+    key: str,
+    config: ApplianceConfiguration,
+) -> list[Platform]:
+    """Return the platforms that get at least one entity for the controls."""
+    control_types = generate_controls_by_type(key, config).keys()
+    return [
+        platform
+        for platform in PLATFORMS
+        if any(
+            issubclass(control_type, CONTROL_TYPES_BY_PLATFORM[platform])
+            for control_type in control_types
+        )
+    ]
+
+
+def clear_controls(key: str) -> None:
+    """Forget the generated controls, e.g. when the config entry is unloaded."""
+    controls.pop(key, None)
+    controls_by_type.pop(key, None)
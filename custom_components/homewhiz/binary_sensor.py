@@ -7,9 +7,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from custom_components.homewhiz import DOMAIN
 from custom_components.homewhiz.appliance_controls import (
+    BINARY_SENSOR_CONTROL_TYPES,
     BooleanControl,
-    WriteBooleanControl,
-    generate_controls_from_config,
+    generate_controls_of_type,
 )
 from custom_components.homewhiz.config_flow import EntryData
 from custom_components.homewhiz.entity import HomeWhizEntity
@@ -42,16 +42,14 @@ async def async_setup_entry(
 ) -> None:
     data = build_entry_data(entry)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    controls = generate_controls_from_config(entry.entry_id, data.contents.config)
-    boolean_controls = [
-        c
-        for c in controls
-        if isinstance(c, BooleanControl) and not isinstance(c, WriteBooleanControl)
+    # Read only boolean controls, WriteBooleanControl is exposed as a switch
+    entities = [
+        HomeWhizBinarySensorEntity(coordinator, control, entry.title, data)
+        for control_type in BINARY_SENSOR_CONTROL_TYPES
+        for control in generate_controls_of_type(
+            entry.entry_id, data.contents.config, control_type
+        )
     ]
-    _LOGGER.debug("Binary sensors: %s", [c.key for c in boolean_controls])
-    async_add_entities(
-        [
-            HomeWhizBinarySensorEntity(coordinator, control, entry.title, data)
-            for control in boolean_controls
-        ]
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Binary sensors: %s", [e.entity_key for e in entities])
+    async_add_entities(entities)
@@ -11,7 +11,7 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .appliance_controls import ClimateControl, generate_controls_from_config
+from .appliance_controls import ClimateControl, generate_controls_of_type
 from .config_flow import EntryData
 from .const import DOMAIN
 from .entity import HomeWhizEntity
@@ -20,6 +20,13 @@ from .homewhiz import HomewhizCoordinator
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+_BASE_FEATURES = (
+    ClimateEntityFeature.TARGET_TEMPERATURE
+    | ClimateEntityFeature.FAN_MODE
+    | ClimateEntityFeature.TURN_OFF
+    | ClimateEntityFeature.TURN_ON
+)
+
 
 class HomeWhizClimateEntity(HomeWhizEntity, ClimateEntity):
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -36,24 +43,18 @@ class HomeWhizClimateEntity(HomeWhizEntity, ClimateEntity):
         super().__init__(coordinator, device_name, control.key, data)
         self._control = control
         self._previous_hvac_mode: HVACMode | None = None
-
-    @property
-    def supported_features(self) -> ClimateEntityFeature:  # type: ignore[override]
-        features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.FAN_MODE
-            | ClimateEntityFeature.TURN_OFF
-            | ClimateEntityFeature.TURN_ON
-        )
-        if self._control.swing.enabled:
+        # The available features and modes are fixed by the appliance config,
+        # so build them once instead of on every state write
+        features = _BASE_FEATURES
+        if control.swing.enabled:
             features |= ClimateEntityFeature.SWING_MODE
-        if self._control.preset_mode.enabled:
+        if control.preset_mode.enabled:
             features |= ClimateEntityFeature.PRESET_MODE
-        return features
-
-    @property
-    def preset_modes(self) -> list[str] | None:
-        return self._control.preset_mode.options
+        self._attr_supported_features = features
+        self._attr_preset_modes = control.preset_mode.options
+        self._attr_hvac_modes = control.hvac_mode.options
+        self._attr_fan_modes = control.fan_mode.options_list
+        self._attr_swing_modes = control.swing.options
 
     @property
     def preset_mode(self) -> str | None:
@@ -67,10 +68,6 @@ class HomeWhizClimateEntity(HomeWhizEntity, ClimateEntity):
         for command in commands:
             await self.coordinator.send_command(command)
 
-    @property
-    def hvac_modes(self) -> list[HVACMode]:  # type: ignore[override]
-        return self._control.hvac_mode.options
-
     @property
     def hvac_mode(self) -> HVACMode | None:  # type: ignore[override]
         data = self.coordinator.data
@@ -122,10 +119,6 @@ class HomeWhizClimateEntity(HomeWhizEntity, ClimateEntity):
     def current_temperature(self) -> float | None:  # type: ignore[override]
         return self._control.current_temperature.get_value(self.coordinator.data)
 
-    @property
-    def fan_modes(self) -> list[str]:  # type: ignore[override]
-        return list(self._control.fan_mode.options.values())
-
     @property
     def fan_mode(self) -> str | None:  # type: ignore[override]
         return self._control.fan_mode.get_value(self.coordinator.data)
@@ -134,10 +127,6 @@ class HomeWhizClimateEntity(HomeWhizEntity, ClimateEntity):
         _LOGGER.debug("Changing fan mode %s", fan_mode)
         await self.coordinator.send_command(self._control.fan_mode.set_value(fan_mode))
 
-    @property
-    def swing_modes(self) -> list[str] | None:  # type: ignore[override]
-        return self._control.swing.options
-
     @property
     def swing_mode(self) -> str | None:  # type: ignore[override]
         if self.coordinator.data is None:
@@ -158,9 +147,11 @@ async def async_setup_entry(
 ) -> None:
     data = build_entry_data(entry)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    controls = generate_controls_from_config(entry.entry_id, data.contents.config)
-    climate_controls = [c for c in controls if isinstance(c, ClimateControl)]
-    _LOGGER.debug("ACs: %s", [c.key for c in climate_controls])
+    climate_controls = generate_controls_of_type(
+        entry.entry_id, data.contents.config, ClimateControl
+    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("ACs: %s", [c.key for c in climate_controls])
     async_add_entities(
         [
             HomeWhizClimateEntity(coordinator, control, entry.title, data)
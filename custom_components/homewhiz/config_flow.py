@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from dataclasses import asdict, dataclass
 from typing import Any
 
 import voluptuous as vol
+from dacite import from_dict
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
@@ -28,23 +30,27 @@ from .api import (
     IdExchangeResponse,
     LoginError,
     LoginResponse,
-    fetch_appliance_contents,
     fetch_appliance_infos,
+    fetch_raw_appliance_contents,
     login,
     make_id_exchange_request,
 )
+from .appliance_config import ApplianceConfiguration
 from .const import CONF_BT_RECONNECT_INTERVAL, DOMAIN
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Local name prefix advertised by HomeWhiz Bluetooth appliances
+_HWZ_PREFIX = "HwZ"
 
-@dataclass
+
+@dataclass(slots=True)
 class CloudConfig:
     username: str
     password: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EntryData:
     ids: IdExchangeResponse
     contents: ApplianceContents
@@ -52,6 +58,36 @@ class EntryData:
     cloud_config: CloudConfig | None
 
 
+def _check_contents(contents: dict[str, Any]) -> dict[str, Any]:
+    """Parse the fetched configuration once, so a malformed one creates no entry.
+
+    The contents are still stored as fetched, setup parses them again.
+    """
+    from_dict(ApplianceConfiguration, contents["config"])
+    return contents
+
+
+def _build_entry_payload(
+    ids: IdExchangeResponse,
+    contents: dict[str, Any],
+    appliance_info: ApplianceInfo | None,
+    cloud_config: CloudConfig | None,
+) -> dict[str, Any]:
+    """Build the config entry data that is read back as EntryData.
+
+    The contents are stored as fetched instead of running asdict over the
+    whole parsed appliance configuration.
+    """
+    return {
+        "ids": asdict(ids),
+        "contents": contents,
+        "appliance_info": asdict(appliance_info)
+        if appliance_info is not None
+        else None,
+        "cloud_config": asdict(cloud_config) if cloud_config is not None else None,
+    }
+
+
 class TiltConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow for HomeWhiz"""
 
@@ -64,7 +100,7 @@ class TiltConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
         self._bt_name: str | None = None
         self._cloud_config: CloudConfig | None = None
         self._cloud_credentials: LoginResponse | None = None
-        self._cloud_appliances: list[ApplianceInfo] | None = None
+        self._cloud_appliances: dict[str, ApplianceInfo] | None = None
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -72,7 +108,7 @@ class TiltConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
         """Handle the bluetooth discovery step."""
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
-        if not discovery_info.name.startswith("HwZ"):
+        if discovery_info.name[:3] != _HWZ_PREFIX:
             return self.async_abort(reason="not_supported")
         self._bt_address = discovery_info.address
         self._bt_name = discovery_info.name
@@ -96,13 +132,15 @@ class TiltConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
             self._bt_name = self._discovered_bt_devices[address]
             return await self.async_step_bluetooth_connect()
 
-        current_addresses = self._async_current_ids()
-        for discovery_info in async_discovered_service_info(self.hass, False):
-            address = discovery_info.address
-            if address in current_addresses or address in self._discovered_bt_devices:
-                continue
-            if discovery_info.name.startswith("HwZ"):
-                self._discovered_bt_devices[address] = discovery_info.name
+        current_addresses = frozenset(self._async_current_ids())
+        discovered = self._discovered_bt_devices
+        discovered.update(
+            (discovery_info.address, discovery_info.name)
+            for discovery_info in async_discovered_service_info(self.hass, False)
+            if discovery_info.address not in current_addresses
+            and discovery_info.address not in discovered
+            and discovery_info.name[:3] == _HWZ_PREFIX
+        )
 
         if len(self._discovered_bt_devices) == 0:
             return self.async_abort(reason="no_devices_found")
@@ -131,10 +169,11 @@ class TiltConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
             try:
                 credentials = await login(username, password)
                 id_response = await make_id_exchange_request(self._bt_name)
-                contents = await fetch_appliance_contents(
-                    credentials, id_response.appId
+                # The contents and appliance infos do not depend on each other
+                contents, appliance_infos = await asyncio.gather(
+                    fetch_raw_appliance_contents(credentials, id_response.appId),
+                    fetch_appliance_infos(credentials),
                 )
-                appliance_infos = await fetch_appliance_infos(credentials)
                 appliance_info = next(
                     (
                         ai
@@ -143,17 +182,16 @@ class TiltConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
                     ),
                     None,
                 )
-                data = EntryData(
-                    ids=id_response,
-                    contents=contents,
-                    appliance_info=appliance_info,
-                    cloud_config=None,
-                )
                 return self.async_create_entry(
                     title=appliance_info.name
                     if appliance_info is not None
                     else self._bt_name,
-                    data=asdict(data),
+                    data=_build_entry_payload(
+                        ids=id_response,
+                        contents=_check_contents(contents),
+                        appliance_info=appliance_info,
+                        cloud_config=None,
+                    ),
                 )
             except LoginError:
                 errors["base"] = "invalid_auth"
@@ -212,32 +250,30 @@ class TiltConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
             appliance_id = user_input[CONF_ID]
             await self.async_set_unique_id(appliance_id)
             self._abort_if_unique_id_configured()
-            appliance = next(
-                a for a in self._cloud_appliances if a.applianceId == appliance_id
-            )
-            contents = await fetch_appliance_contents(
+            appliance = self._cloud_appliances[appliance_id]
+            contents = await fetch_raw_appliance_contents(
                 self._cloud_credentials, appliance_id
             )
-            data = EntryData(
-                ids=IdExchangeResponse(appliance_id),
-                contents=contents,
-                appliance_info=appliance,
-                cloud_config=self._cloud_config,
-            )
             return self.async_create_entry(
                 title=appliance.name,
-                data=asdict(data),
+                data=_build_entry_payload(
+                    ids=IdExchangeResponse(appliance_id),
+                    contents=_check_contents(contents),
+                    appliance_info=appliance,
+                    cloud_config=self._cloud_config,
+                ),
             )
 
         if self._cloud_appliances is None:
-            self._cloud_appliances = await fetch_appliance_infos(
-                self._cloud_credentials
-            )
+            self._cloud_appliances = {
+                appliance.applianceId: appliance
+                for appliance in await fetch_appliance_infos(self._cloud_credentials)
+            }
         if len(self._cloud_appliances) == 0:
             return self.async_abort(reason="no_devices_found")
         options = {
-            appliance.applianceId: appliance.name
-            for appliance in self._cloud_appliances
+            appliance_id: appliance.name
+            for appliance_id, appliance in self._cloud_appliances.items()
             if not appliance.is_bt()
         }
 
@@ -1,21 +1,31 @@
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .config_flow import EntryData
 from .const import DOMAIN
-from .homewhiz import HomewhizCoordinator, brand_name_by_code
+from .homewhiz import DEFAULT_BRAND_NAME, HomewhizCoordinator, brand_name_by_code
+
+if TYPE_CHECKING:
+    from .appliance_controls import Control
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# The device info is identical for all entities of a device, so share a single
+# instance per device name and entry data
+_DEVICE_INFO_CACHE: dict[tuple[str, int], DeviceInfo] = {}
+
 
 def build_device_info(unique_name: str, data: EntryData) -> DeviceInfo:
     friendly_name = (
         data.appliance_info.name if data.appliance_info is not None else unique_name
     )
     manufacturer = (
-        brand_name_by_code[data.appliance_info.brand]
+        brand_name_by_code.get(data.appliance_info.brand, DEFAULT_BRAND_NAME)
         if data.appliance_info is not None
         else None
     )
@@ -28,6 +38,22 @@ def build_device_info(unique_name: str, data: EntryData) -> DeviceInfo:
     )
 
 
+def _get_device_info(unique_name: str, data: EntryData) -> DeviceInfo:
+    key = (unique_name, id(data))
+    device_info = _DEVICE_INFO_CACHE.get(key)
+    if device_info is None:
+        device_info = build_device_info(unique_name, data)
+        _DEVICE_INFO_CACHE[key] = device_info
+    return device_info
+
+
+def clear_device_info_cache(data: EntryData) -> None:
+    """Forget the device info shared by the entities built from data."""
+    data_id = id(data)
+    for key in [key for key in _DEVICE_INFO_CACHE if key[1] == data_id]:
+        del _DEVICE_INFO_CACHE[key]
+
+
 class HomeWhizEntity(CoordinatorEntity[HomewhizCoordinator]):  # type: ignore[type-arg]
     _attr_has_entity_name = True
 
@@ -40,26 +66,19 @@ class HomeWhizEntity(CoordinatorEntity[HomewhizCoordinator]):  # type: ignore[ty
     ):
         super().__init__(coordinator)
         self.entity_key = entity_key
+        self._attr_translation_key = entity_key.lower().partition("#")[0]
         self._attr_unique_id = f"{device_name}_{entity_key}"
-        self._attr_device_info = build_device_info(device_name, data)
+        self._attr_device_info = _get_device_info(device_name, data)
         self._attr_device_class = f"{DOMAIN}__{entity_key}"
-        self._localization = data.contents.localization
-
-    async def async_added_to_hass(self) -> None:
-        """Call when the entity is added to hass."""
-        # Provide an attribute to identify the origin of the data used
-        await super().async_added_to_hass()
-        if hasattr(self, "_control"):
-            if hasattr(self._control, "my_entity_ids"):
-                self._control.my_entity_ids.update({self.entity_id: self.name})
-            else:
-                setattr(self._control, "my_entity_ids", {self.entity_id: self.name})
+
+    def _register_control_mapping(self, control: Control) -> None:
+        """Provide an attribute to identify the origin of the data used."""
+        mapping = getattr(control, "my_entity_ids", None)
+        if mapping is None:
+            setattr(control, "my_entity_ids", {self.entity_id: self.name})
+        else:
+            mapping[self.entity_id] = self.name
 
     @property
     def available(self) -> bool:  # type: ignore[override]
         return self.coordinator.is_connected
-
-    @property
-    def translation_key(self) -> str | None:  # type: ignore[override]
-        """Translation key for this entity."""
-        return self.entity_key.lower().split("#")[0]
@@ -1,36 +1,137 @@
 from __future__ import annotations
 
-from dacite import from_dict
+from collections.abc import Callable, Mapping
+from dataclasses import MISSING, fields, is_dataclass
+from functools import cache
+from types import NoneType, UnionType
+from typing import Any, TypeVar, get_args, get_origin, get_type_hints
+
+from dacite import MissingValueError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import REVOLUTIONS_PER_MINUTE, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
 
-from custom_components.homewhiz import IdExchangeResponse
-from custom_components.homewhiz.api import ApplianceContents, ApplianceInfo
+from custom_components.homewhiz.api import (
+    ApplianceContents,
+    ApplianceInfo,
+    IdExchangeResponse,
+)
 from custom_components.homewhiz.config_flow import EntryData
+from custom_components.homewhiz.entity import clear_device_info_cache
+
+_T = TypeVar("_T")
+
+# Every platform rebuilds the same entry data during setup, so keep the
+# deserialized result per entry id until the entry is unloaded or updated
+_ENTRY_CACHE: dict[str, EntryData] = {}
+
+
+def _build_converter(type_: Any) -> Callable[[Any], Any] | None:
+    """Return a converter for values of type_, None if they are kept as they are"""
+    origin = get_origin(type_)
+    if origin is UnionType:
+        args = [arg for arg in get_args(type_) if arg is not NoneType]
+        if len(args) != 1:
+            return None
+        convert_inner = _build_converter(args[0])
+        if convert_inner is None:
+            return None
+        return lambda value: None if value is None else convert_inner(value)
+    if origin is list:
+        convert_item = _build_converter(get_args(type_)[0])
+        if convert_item is None:
+            return list
+        return lambda value: [convert_item(item) for item in value]
+    if origin is dict:
+        return dict
+    if is_dataclass(type_):
+        return _build_factory(type_)  # type: ignore[arg-type]
+    return None
+
+
+@cache
+def _build_factory(cls: type[_T]) -> Callable[[Mapping[str, Any]], _T]:
+    """Build a constructor for cls from its dict representation.
+
+    Type hints are resolved once per dataclass instead of on every call,
+    which matters for the large ApplianceConfiguration trees. Unknown keys are
+    ignored and missing optional fields default to None, like dacite does.
+    """
+    hints = get_type_hints(cls)
+    specs = [
+        (
+            field.name,
+            _build_converter(hints[field.name]),
+            field.default is not MISSING or field.default_factory is not MISSING,
+            NoneType in get_args(hints[field.name]),
+        )
+        for field in fields(cls)  # type: ignore[arg-type]
+        if field.init
+    ]
+
+    def factory(data: Mapping[str, Any]) -> _T:
+        kwargs: dict[str, Any] = {}
+        for name, convert, has_default, is_optional in specs:
+            if name in data:
+                value = data[name]
+                kwargs[name] = value if convert is None else convert(value)
+            elif not has_default:
+                if not is_optional:
+                    raise MissingValueError(name)
+                kwargs[name] = None
+        return cls(**kwargs)
+
+    return factory
 
 
 def build_entry_data(entry: ConfigEntry) -> EntryData:
-    return EntryData(
-        contents=from_dict(ApplianceContents, entry.data["contents"]),
-        appliance_info=from_dict(ApplianceInfo, entry.data["appliance_info"])
+    if (cached := _ENTRY_CACHE.get(entry.entry_id)) is not None:
+        return cached
+    data = EntryData(
+        contents=_build_factory(ApplianceContents)(entry.data["contents"]),
+        appliance_info=_build_factory(ApplianceInfo)(entry.data["appliance_info"])
         if entry.data["appliance_info"] is not None
         else None,
-        ids=from_dict(IdExchangeResponse, entry.data["ids"]),
+        ids=_build_factory(IdExchangeResponse)(entry.data["ids"]),
         cloud_config=None,
     )
+    _ENTRY_CACHE[entry.entry_id] = data
+    return data
+
+
+def register_entry_cache_cleanup(entry: ConfigEntry) -> None:
+    """Drop the cached entry data once the entry is unloaded or updated."""
+
+    @callback
+    def clear_entry_cache() -> None:
+        if (data := _ENTRY_CACHE.pop(entry.entry_id, None)) is not None:
+            clear_device_info_cache(data)
+
+    async def entry_updated(_hass: HomeAssistant, _entry: ConfigEntry) -> None:
+        clear_entry_cache()
+
+    entry.async_on_unload(clear_entry_cache)
+    entry.async_on_unload(entry.add_update_listener(entry_updated))
+
+
+# Substring of a feature key mapped to the unit and icon used for it
+_KEY_META: tuple[tuple[str, str, str], ...] = (
+    ("temp", UnitOfTemperature.CELSIUS, "mdi:thermometer"),
+    ("spin", REVOLUTIONS_PER_MINUTE, "mdi:rotate-3d-variant"),
+)
+
+
+def meta_for_key(key: str) -> tuple[str | None, str | None]:
+    """Return the unit and icon for a feature key with a single scan."""
+    for needle, unit, icon in _KEY_META:
+        if needle in key:
+            return unit, icon
+    return None, None
 
 
 def unit_for_key(key: str) -> str | None:
-    if "temp" in key:
-        return UnitOfTemperature.CELSIUS
-    if "spin" in key:
-        return REVOLUTIONS_PER_MINUTE
-    return None
+    return meta_for_key(key)[0]
 
 
 def icon_for_key(key: str) -> str | None:
-    if "temp" in key:
-        return "mdi:thermometer"
-    if "spin" in key:
-        return "mdi:rotate-3d-variant"
-    return None
+    return meta_for_key(key)[1]
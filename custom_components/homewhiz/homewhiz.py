@@ -33,8 +33,11 @@ class HomewhizCoordinator(
         pass
 
 
+# Arcelik (code 1) and unknown brands are not listed explicitly
+DEFAULT_BRAND_NAME = "Arcelik"
+
 brand_name_by_code = defaultdict(
-    lambda: "Arcelik",
+    lambda: DEFAULT_BRAND_NAME,
     {
         2: "Grundig",
         3: "Beko",
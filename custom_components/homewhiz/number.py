@@ -12,7 +12,7 @@ from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .appliance_controls import WriteTimeControl, generate_controls_from_config
+from .appliance_controls import WriteTimeControl, generate_controls_of_type
 from .config_flow import EntryData
 from .const import DOMAIN
 from .entity import HomeWhizEntity
@@ -62,9 +62,11 @@ async def async_setup_entry(
 ) -> None:
     data = build_entry_data(entry)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    controls = generate_controls_from_config(entry.entry_id, data.contents.config)
-    number_controls = [c for c in controls if isinstance(c, WriteTimeControl)]
-    _LOGGER.debug("Numbers: %s", [c.key for c in number_controls])
+    number_controls = generate_controls_of_type(
+        entry.entry_id, data.contents.config, WriteTimeControl
+    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Numbers: %s", [c.key for c in number_controls])
     async_add_entities(
         [
             HomeWhizNumberEntity(coordinator, control, entry.title, data)
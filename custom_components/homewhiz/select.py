@@ -9,11 +9,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .appliance_controls import (
+    SELECT_CONTROL_TYPES,
     HobZoneHeaterLevelControl,
     HobZonePredefinedProgramControl,
     WriteEnumControl,
     WriteNumericControl,
-    generate_controls_from_config,
+    generate_controls_of_types,
     get_bounded_values_options,
 )
 from .config_flow import EntryData
@@ -53,7 +54,7 @@ class HomeWhizSelectEntity(HomeWhizEntity, SelectEntity):
             if isinstance(control, WriteNumericControl)
             else control
         )
-        self._attr_options = list(self._control.options.values())
+        self._attr_options = self._control.options_list
 
     @property
     def current_option(self) -> str | None:  # type: ignore[override]
@@ -94,11 +95,14 @@ async def async_setup_entry(
 ) -> None:
     data = build_entry_data(entry)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    controls = generate_controls_from_config(entry.entry_id, data.contents.config)
-    write_enum_controls = [
-        c for c in controls if isinstance(c, (WriteEnumControl, WriteNumericControl))
-    ]
-    _LOGGER.debug("Selects: %s", [c.key for c in write_enum_controls])
+    # The hob controls subclass the write controls and are included as well
+    write_enum_controls = generate_controls_of_types(
+        entry.entry_id,
+        data.contents.config,
+        SELECT_CONTROL_TYPES,
+    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Selects: %s", [c.key for c in write_enum_controls])
     async_add_entities(
         [
             HomeWhizSelectEntity(coordinator, control, entry.title, data)
@@ -1,23 +1,22 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
-from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .appliance_controls import (
+    SENSOR_CONTROL_TYPES,
     DebugControl,
     EnumControl,
     NumericControl,
     StateAwareRemainingTimeControl,
     SummedTimestampControl,
     TimeControl,
-    generate_controls_from_config,
+    generate_controls_of_types,
 )
 from .config_flow import EntryData
 from .const import DOMAIN
@@ -25,10 +24,18 @@ from .entity import HomeWhizEntity
 from .helper import build_entry_data
 from .homewhiz import HomewhizCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from datetime import datetime
+
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
 class HomeWhizSensorEntity(HomeWhizEntity, SensorEntity):
+    # The Home Assistant bases keep their instance dict, only our own
+    # references are slotted
+    __slots__ = ("_control", "_last_data", "_last_value", "_last_written")
+
     def __init__(
         self,
         coordinator: HomewhizCoordinator,
@@ -43,46 +50,70 @@ class HomeWhizSensorEntity(HomeWhizEntity, SensorEntity):
     ):
         super().__init__(coordinator, device_name, control.key, data)
         self._control = control
+        # Coordinator updates always carry a new bytearray, so the last value is
+        # reused for as long as the data it was read from is current
+        self._last_data: bytearray | None = None
+        self._last_value: float | int | str | datetime | None = None
+        self._last_written: tuple[Any, bool, Mapping[str, Any] | None] | None = None
         if isinstance(control, (TimeControl, StateAwareRemainingTimeControl)):
             self._attr_icon = "mdi:clock-outline"
             self._attr_native_unit_of_measurement = "min"
             self._attr_device_class = SensorDeviceClass.DURATION
         elif isinstance(control, EnumControl):
-            self._attr_device_class = SensorDeviceClass.ENUM  # type:ignore
-            self._attr_options = list(self._control.options.values())  # type:ignore
+            self._attr_device_class = SensorDeviceClass.ENUM
+            self._attr_options = control.options_list
         elif isinstance(control, SummedTimestampControl):
             self._attr_icon = "mdi:camera-timer"
             self._attr_device_class = SensorDeviceClass.TIMESTAMP
 
+    async def async_added_to_hass(self) -> None:
+        """Call when the entity is added to hass."""
+        await super().async_added_to_hass()
+        # Summed timestamp sensors list the entities of the sensors they use
+        self._register_control_mapping(self._control)
+
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:  # type: ignore[override]
         """Attribute to identify the origin of the data used"""
         if isinstance(self._control, SummedTimestampControl):
-            return {
-                "sources": [
-                    x.my_entity_ids
-                    for x in self._control.sensors
-                    if hasattr(x, "my_entity_ids")
-                ]
-            }
+            # The mappings keep filling in as the sensors are added, so hand
+            # out a copy that later writes can be compared against
+            return {"sources": [dict(mapping) for mapping in self._control.sources()]}
         return None
 
     @property
     def native_value(  # type: ignore[override]
         self,
     ) -> float | int | str | datetime | None:
-        _LOGGER.debug(
-            "Native value for entity %s, id: %s, info: %s, class:%s, is %s",
-            self.entity_key,
-            self._attr_unique_id,
-            self._attr_device_info,
-            self._attr_device_class,
-            self.coordinator.data,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Native value for entity %s, id: %s, info: %s, class:%s, is %s",
+                self.entity_key,
+                self._attr_unique_id,
+                self._attr_device_info,
+                self._attr_device_class,
+                self.coordinator.data,
+            )
 
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return None
-        return self._control.get_value(self.coordinator.data)
+        if data is not self._last_data:
+            self._last_value = self._control.get_value(data)
+            self._last_data = data
+        return self._last_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Skip the state write when value, availability and attributes are unchanged.
+
+        Skipped updates do not advance last_reported of the state.
+        """
+        state = (self.native_value, self.available, self.extra_state_attributes)
+        if state == self._last_written:
+            return
+        self._last_written = state
+        super()._handle_coordinator_update()
 
 
 async def async_setup_entry(
@@ -90,32 +121,19 @@ async def async_setup_entry(
 ) -> None:
     data = build_entry_data(entry)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    controls = generate_controls_from_config(entry.entry_id, data.contents.config)
-    _LOGGER.debug("Generated controls: %s", controls)
-    sensor_controls = [
-        c
-        for c in controls
-        if isinstance(
-            c,
-            (
-                TimeControl,
-                EnumControl,
-                NumericControl,
-                DebugControl,
-                SummedTimestampControl,
-                StateAwareRemainingTimeControl,
-            ),
-        )
-    ]
-
-    _LOGGER.debug("Sensors: %s", [c.key for c in sensor_controls])
+    # Also matches the writable subclasses, which get a read-only sensor as well
+    sensor_controls = generate_controls_of_types(
+        entry.entry_id, data.contents.config, SENSOR_CONTROL_TYPES
+    )
 
     homewhiz_sensor_entities = [
         HomeWhizSensorEntity(coordinator, control, entry.title, data)
         for control in sensor_controls
     ]
-    _LOGGER.debug(
-        "Entities: %s",
-        {entity.entity_key: entity for entity in homewhiz_sensor_entities},
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Sensors: %s", [c.key for c in sensor_controls])
+        _LOGGER.debug(
+            "Entities: %s",
+            {entity.entity_key: entity for entity in homewhiz_sensor_entities},
+        )
     async_add_entities(homewhiz_sensor_entities)
@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .appliance_controls import WriteBooleanControl, generate_controls_from_config
+from .appliance_controls import WriteBooleanControl, generate_controls_of_type
 from .config_flow import EntryData
 from .const import DOMAIN
 from .entity import HomeWhizEntity
@@ -19,6 +19,8 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
 class HomeWhizSwitchEntity(HomeWhizEntity, SwitchEntity):
+    __slots__ = ("_control",)
+
     def __init__(
         self,
         coordinator: HomewhizCoordinator,
@@ -47,12 +49,12 @@ async def async_setup_entry(
 ) -> None:
     data = build_entry_data(entry)
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    controls = generate_controls_from_config(entry.entry_id, data.contents.config)
-    write_enum_controls = [c for c in controls if isinstance(c, WriteBooleanControl)]
-    _LOGGER.debug("Switches: %s", [c.key for c in write_enum_controls])
-    async_add_entities(
-        [
-            HomeWhizSwitchEntity(coordinator, control, entry.title, data)
-            for control in write_enum_controls
-        ]
-    )
+    entities = [
+        HomeWhizSwitchEntity(coordinator, control, entry.title, data)
+        for control in generate_controls_of_type(
+            entry.entry_id, data.contents.config, WriteBooleanControl
+        )
+    ]
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Switches: %s", [e.entity_key for e in entities])
+    async_add_entities(entities)
@@ -0,0 +1,144 @@
+"""Tests for the config flow steps that fetch the appliance contents.
+
+The flow is created without hass. The API calls and the flow helpers that
+need hass are patched, and async code runs through asyncio.run() from sync
+tests, like in test_bluetooth.
+"""
+
+# ruff: noqa: SLF001
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from dacite import DaciteError
+
+from custom_components.homewhiz import config_flow
+from custom_components.homewhiz.api import (
+    ApplianceInfo,
+    IdExchangeResponse,
+    LoginError,
+    LoginResponse,
+)
+from custom_components.homewhiz.config_flow import CloudConfig, TiltConfigFlow
+
+_CREDENTIALS = LoginResponse("access", "secret", "token", 0)
+_APPLIANCE = ApplianceInfo(
+    id=1,
+    applianceId="app-id",
+    brand=1,
+    model="model",
+    applianceType=1,
+    platformType="platform",
+    applianceSerialNumber=None,
+    name="Washer",
+    hsmId=None,
+)
+# A section with the wrong type, which the setup factory would not catch
+_INVALID_CONTENTS: dict[str, Any] = {
+    "config": {"program": "not a program"},
+    "localization": {},
+}
+
+
+def _valid_contents() -> dict[str, Any]:
+    file_path = (
+        Path(__file__).parent / "fixtures" / "example_washing_machine_config.json"
+    )
+    with file_path.open() as file:
+        return {"config": json.load(file), "localization": {}}
+
+
+def _make_flow() -> TiltConfigFlow:
+    flow = TiltConfigFlow()
+    flow.async_set_unique_id = AsyncMock()  # type: ignore[method-assign]
+    flow._abort_if_unique_id_configured = Mock()  # type: ignore[method-assign]
+    flow.async_create_entry = Mock()  # type: ignore[method-assign]
+    return flow
+
+
+def _run_bluetooth_connect(
+    flow: TiltConfigFlow,
+    contents: dict[str, Any],
+    login: AsyncMock | None = None,
+    id_exchange: AsyncMock | None = None,
+) -> Any:
+    flow._bt_address = "00:11:22:33:44:55"
+    flow._bt_name = "HwZ_washer"
+    with (
+        patch.object(
+            config_flow, "login", login or AsyncMock(return_value=_CREDENTIALS)
+        ),
+        patch.object(
+            config_flow,
+            "make_id_exchange_request",
+            id_exchange or AsyncMock(return_value=IdExchangeResponse("app-id")),
+        ),
+        patch.object(
+            config_flow,
+            "fetch_raw_appliance_contents",
+            AsyncMock(return_value=contents),
+        ),
+        patch.object(
+            config_flow, "fetch_appliance_infos", AsyncMock(return_value=[_APPLIANCE])
+        ),
+    ):
+        return asyncio.run(
+            flow.async_step_bluetooth_connect({"username": "user", "password": "pw"})
+        )
+
+
+def test_bluetooth_connect_stores_fetched_contents() -> None:
+    flow = _make_flow()
+    contents = _valid_contents()
+    _run_bluetooth_connect(flow, contents)
+
+    flow.async_create_entry.assert_called_once()  # type: ignore[attr-defined]
+    data = flow.async_create_entry.call_args.kwargs["data"]  # type: ignore[attr-defined]
+    assert data["contents"] is contents
+
+
+def test_bluetooth_connect_rejects_invalid_config() -> None:
+    flow = _make_flow()
+    with pytest.raises(DaciteError):
+        _run_bluetooth_connect(flow, _INVALID_CONTENTS)
+    flow.async_create_entry.assert_not_called()  # type: ignore[attr-defined]
+
+
+def test_bluetooth_connect_reports_invalid_auth() -> None:
+    flow = _make_flow()
+    flow.async_show_form = Mock()  # type: ignore[method-assign]
+    # The id exchange would fail as well, but only runs after a successful login
+    id_exchange = AsyncMock(side_effect=RuntimeError("id exchange failed"))
+    _run_bluetooth_connect(
+        flow,
+        _valid_contents(),
+        login=AsyncMock(side_effect=LoginError()),
+        id_exchange=id_exchange,
+    )
+
+    id_exchange.assert_not_awaited()
+    flow.async_create_entry.assert_not_called()  # type: ignore[attr-defined]
+    assert flow.async_show_form.call_args.kwargs["errors"] == {  # type: ignore[attr-defined]
+        "base": "invalid_auth"
+    }
+
+
+def test_select_cloud_device_rejects_invalid_config() -> None:
+    flow = _make_flow()
+    flow._cloud_credentials = _CREDENTIALS
+    flow._cloud_config = CloudConfig("user", "pw")
+    flow._cloud_appliances = {_APPLIANCE.applianceId: _APPLIANCE}
+    with (
+        patch.object(
+            config_flow,
+            "fetch_raw_appliance_contents",
+            AsyncMock(return_value=_INVALID_CONTENTS),
+        ),
+        pytest.raises(DaciteError),
+    ):
+        asyncio.run(flow.async_step_select_cloud_device({"id": "app-id"}))
+    flow.async_create_entry.assert_not_called()  # type: ignore[attr-defined]
@@ -4,14 +4,22 @@ from unittest import TestCase
 
 import pytest
 from dacite import from_dict
+from homeassistant.const import Platform
 
 from custom_components.homewhiz.appliance_config import ApplianceConfiguration
 from custom_components.homewhiz.appliance_controls import (
     EnumControl,
+    SummedTimestampControl,
+    TimeControl,
     WriteEnumControl,
     WriteTimeControl,
     build_control_from_program,
+    clear_controls,
+    generate_controls_by_type,
     generate_controls_from_config,
+    generate_controls_of_type,
+    generate_controls_of_types,
+    platforms_for_controls,
 )
 from custom_components.homewhiz.homewhiz import Command
 
@@ -48,6 +56,28 @@ def test_options_order(config: ApplianceConfiguration) -> None:
     )
 
 
+def test_controls_by_type(config: ApplianceConfiguration) -> None:
+    controls = generate_controls_from_config("test_controls_by_type", config)
+    buckets = generate_controls_by_type("test_controls_by_type", config)
+    assert generate_controls_by_type("test_controls_by_type", config) is buckets
+    for control_type, bucket in buckets.items():
+        assert all(type(control) is control_type for control in bucket)
+    grouped = [control for bucket in buckets.values() for control in bucket]
+    assert sorted(map(id, grouped)) == sorted(map(id, controls))
+
+    enum_controls = generate_controls_of_types(
+        "test_controls_by_type", config, (EnumControl,)
+    )
+    assert enum_controls
+    assert enum_controls == [c for c in grouped if isinstance(c, EnumControl)]
+    assert generate_controls_of_type(
+        "test_controls_by_type", config, WriteEnumControl
+    ) == [c for c in grouped if type(c) is WriteEnumControl]
+
+    clear_controls("test_controls_by_type")
+    assert generate_controls_by_type("test_controls_by_type", config) is not buckets
+
+
 def test_writable_start_delay(config: ApplianceConfiguration) -> None:
     controls = generate_controls_from_config("test_writable_start_delay", config)
     controls_map = {control.key: control for control in controls}
@@ -95,3 +125,38 @@ def test_program_options_with_duplicate_names() -> None:
     # name (byte 7), the duplicate carries its byte value as suffix.
     assert control.set_value("program_mix") == Command(control.write_index, 7)
     assert control.set_value("program_mix_16") == Command(control.write_index, 16)
+
+
+def test_summed_timestamp_sources() -> None:
+    remaining = TimeControl("remaining", 1, 2)
+    delay = TimeControl("delay", 3, 4)
+    control = SummedTimestampControl("estimated_end", [remaining, delay])
+    assert control.sources() == []
+
+    # The mappings are added once the sensor entities are added to hass
+    remaining.my_entity_ids = {"sensor.remaining": "Remaining"}  # type: ignore[attr-defined]
+    assert control.sources() == [{"sensor.remaining": "Remaining"}]
+    delay.my_entity_ids = {"sensor.delay": "Delay"}  # type: ignore[attr-defined]
+    sources = control.sources()
+    assert sources == [
+        {"sensor.remaining": "Remaining"},
+        {"sensor.delay": "Delay"},
+    ]
+    assert control.sources() is sources
+
+
+def test_platforms_for_controls(config: ApplianceConfiguration) -> None:
+    assert platforms_for_controls("test_platforms_for_controls", config) == [
+        Platform.SELECT,
+        Platform.SENSOR,
+        Platform.NUMBER,
+        Platform.SWITCH,
+        Platform.BINARY_SENSOR,
+    ]
+
+    file_path = Path(__file__).parent / "fixtures" / "example_ac_config.json"
+    with file_path.open() as file:
+        ac_config = from_dict(ApplianceConfiguration, json.load(file))
+    assert platforms_for_controls("test_platforms_for_controls_ac", ac_config) == [
+        Platform.CLIMATE
+    ]
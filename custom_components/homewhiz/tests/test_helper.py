@@ -0,0 +1,60 @@
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from dacite import from_dict
+
+from custom_components.homewhiz.appliance_config import ApplianceConfiguration
+from custom_components.homewhiz.entity import _DEVICE_INFO_CACHE, _get_device_info
+from custom_components.homewhiz.helper import (
+    _build_factory,
+    build_entry_data,
+    register_entry_cache_cleanup,
+)
+
+
+@pytest.fixture
+def entry() -> Any:
+    file_path = Path(__file__).parent / "fixtures" / "refrigerator-375.json"
+    with file_path.open() as file:
+        json_content = json.load(file)
+    entry = Mock()
+    entry.entry_id = "test_helper"
+    entry.title = "Fridge"
+    entry.data = {
+        "ids": {"appId": "test_helper"},
+        "contents": {"config": json_content, "localization": {}},
+        "appliance_info": None,
+        "cloud_config": None,
+    }
+    entry.unload_callbacks = []
+    entry.async_on_unload = entry.unload_callbacks.append
+    return entry
+
+
+def test_entry_data_is_cached_until_unload(entry: Any) -> None:
+    register_entry_cache_cleanup(entry)
+    data = build_entry_data(entry)
+    assert build_entry_data(entry) is data
+    device_info = _get_device_info(entry.title, data)
+    assert _get_device_info(entry.title, data) is device_info
+
+    for unload_callback in entry.unload_callbacks:
+        unload_callback()
+    assert (entry.title, id(data)) not in _DEVICE_INFO_CACHE
+    assert build_entry_data(entry) is not data
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    sorted((Path(__file__).parent / "fixtures").glob("*.json")),
+    ids=lambda path: path.name,
+)
+def test_factory_matches_dacite(file_path: Path) -> None:
+    with file_path.open() as file:
+        json_content = json.load(file)
+    assert _build_factory(ApplianceConfiguration)(json_content) == from_dict(
+        ApplianceConfiguration, json_content
+    )
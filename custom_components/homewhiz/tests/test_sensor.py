@@ -0,0 +1,86 @@
+"""Tests for the state writes of the sensor entity on coordinator updates.
+
+The entity is created without hass, with a mocked coordinator and state write.
+"""
+
+# ruff: noqa: SLF001
+
+from typing import Any
+from unittest.mock import Mock
+
+from custom_components.homewhiz.appliance_controls import (
+    EnumControl,
+    SummedTimestampControl,
+    TimeControl,
+)
+from custom_components.homewhiz.sensor import HomeWhizSensorEntity
+
+
+def _make_entity(control: Any) -> tuple[HomeWhizSensorEntity, Any, Mock]:
+    coordinator = Mock()
+    coordinator.is_connected = True
+    coordinator.data = None
+    entity = HomeWhizSensorEntity(
+        coordinator, control, "device", Mock(appliance_info=None)
+    )
+    write = Mock()
+    entity.async_write_ha_state = write  # type: ignore[method-assign]
+    return entity, coordinator, write
+
+
+def test_unchanged_updates_are_not_written() -> None:
+    control = EnumControl("state", 1, {1: "on", 2: "off"})
+    entity, coordinator, write = _make_entity(control)
+
+    coordinator.data = bytearray([0, 1])
+    entity._handle_coordinator_update()
+    assert write.call_count == 1
+    assert entity.native_value == "on"
+
+    # Same data object
+    entity._handle_coordinator_update()
+    assert write.call_count == 1
+
+    # New data with the same value
+    coordinator.data = bytearray([0, 1])
+    entity._handle_coordinator_update()
+    assert write.call_count == 1
+
+    # Disconnect
+    coordinator.is_connected = False
+    entity._handle_coordinator_update()
+    assert write.call_count == 2
+
+    # New value
+    coordinator.is_connected = True
+    coordinator.data = bytearray([0, 2])
+    entity._handle_coordinator_update()
+    assert write.call_count == 3
+    assert entity.native_value == "off"
+
+
+def test_source_attribute_changes_are_written() -> None:
+    remaining = TimeControl("remaining", 1, 2)
+    control = SummedTimestampControl("estimated_end", [remaining])
+    entity, coordinator, write = _make_entity(control)
+
+    coordinator.data = bytearray([0, 0, 0])
+    entity._handle_coordinator_update()
+    assert write.call_count == 1
+    assert entity.extra_state_attributes == {"sources": []}
+
+    # The source sensor is added to hass, the value stays the same
+    remaining.my_entity_ids = {"sensor.remaining": "Remaining"}  # type: ignore[attr-defined]
+    entity._handle_coordinator_update()
+    assert write.call_count == 2
+
+    # A second entity for the same control fills in the existing mapping
+    remaining.my_entity_ids["select.remaining"] = "Remaining"  # type: ignore[attr-defined]
+    entity._handle_coordinator_update()
+    assert write.call_count == 3
+    assert entity.extra_state_attributes == {
+        "sources": [{"sensor.remaining": "Remaining", "select.remaining": "Remaining"}]
+    }
+
+    entity._handle_coordinator_update()
+    assert write.call_count == 3